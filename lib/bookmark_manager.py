@@ -8,68 +8,293 @@ Supports adding, listing, searching, and deleting bookmarks via command-line int
 
 import argparse
 import json
+import mmap
 import os
+import re
+import stat
 import sys
-from urllib.parse import urlparse
-from typing import List, Dict, Optional
+from bisect import bisect_left, insort
+from collections import Counter, defaultdict
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# The fields every saved bookmark has
+_SCHEMA_KEYS = frozenset(("url", "title", "tag"))
+# Lowercased copies of the searchable fields, kept in memory but never saved
+_CACHED_KEYS = frozenset(("_url_lc", "_title_lc", "_tag_lc"))
+_KNOWN_KEYS = _SCHEMA_KEYS | _CACHED_KEYS
+
+
+def _persisted(bookmarks: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Copy bookmarks without the in-memory-only cached fields."""
+    return [
+        {k: v for k, v in bookmark.items() if k not in _CACHED_KEYS}
+        for bookmark in bookmarks
+    ]
+
+
+def _dump_compact(bookmarks: List[Dict[str, str]]) -> bytes:
+    """Serialize bookmarks as compact ASCII JSON, specialized for the fixed schema.
+
+    Writes url, title and tag directly instead of walking each dict through the
+    generic encoder. Bookmarks carrying extra fields use the generic encoder.
+    """
+    encode = json.encoder.encode_basestring_ascii
+    parts = []
+    for bookmark in bookmarks:
+        # url, title and tag, plus whichever cached lowercase copies exist
+        if not _SCHEMA_KEYS <= bookmark.keys() <= _KNOWN_KEYS:
+            generic = json.dumps(_persisted(bookmarks), separators=(",", ":"))
+            return generic.encode("ascii")
+        parts.append(
+            f'{{"url":{encode(bookmark["url"])},'
+            f'"title":{encode(bookmark["title"])},'
+            f'"tag":{encode(bookmark["tag"])}}}'
+        )
+    return ("[" + ",".join(parts) + "]").encode("ascii")
+
+
+if orjson is not None:
+
+    def _loads(data: memoryview):
+        return orjson.loads(data)
+
+    def _dumps(bookmarks: List[Dict[str, str]], pretty: bool = False) -> bytes:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(_persisted(bookmarks), option=option)
+
+else:
+
+    def _loads(data: memoryview):
+        return json.loads(str(data, "utf-8"))
+
+    def _dumps(bookmarks: List[Dict[str, str]], pretty: bool = False) -> bytes:
+        if pretty:
+            return json.dumps(
+                _persisted(bookmarks), indent=2, ensure_ascii=False
+            ).encode("utf-8")
+        return _dump_compact(bookmarks)
+
 
 bookmarks_path = os.path.join(os.path.expanduser("~"), ".bookmarks.json")
 
+# scheme://netloc, the two parts a bookmark URL must have
+_URL_RE = re.compile(r"\s*[A-Za-z][A-Za-z0-9+.-]*://[^/?#\s]")
+
 
 class BookmarkManager:
     """Main class for managing bookmarks with JSON file persistence."""
 
-    def __init__(self, data_file: str = bookmarks_path):
-        """Initialize the bookmark manager with specified data file."""
+    __slots__ = (
+        "data_file",
+        "pretty",
+        "_bookmarks",
+        "_lowered_fields",
+        "_indexes",
+        "_counts",
+        "_sorted",
+    )
+
+    def __init__(self, data_file: str = bookmarks_path, pretty: bool = False):
+        """Initialize the bookmark manager with specified data file.
+
+        Saves write compact JSON unless pretty is set, which indents the file.
+        """
         self.data_file = data_file
-        self.bookmarks = self._load_bookmarks()
+        self.pretty = pretty
+        self._bookmarks: Optional[List[Dict[str, str]]] = None
+
+    @property
+    def bookmarks(self) -> List[Dict[str, str]]:
+        """The bookmark list, loaded and indexed on first access."""
+        self._ensure_loaded()
+        return self._bookmarks
+
+    @bookmarks.setter
+    def bookmarks(self, bookmarks: List[Dict[str, str]]) -> None:
+        self._bookmarks = bookmarks
+
+    def _ensure_loaded(self) -> None:
+        """Load the bookmarks if that hasn't happened yet."""
+        if self._bookmarks is None:
+            self._bookmarks = self._load_bookmarks()
+            self._lowered_fields: set = set()
+            # Lookup indexes are built per field on their first lookup
+            self._indexes: Dict[str, Dict[str, List[int]]] = {}
+            # Only tag/title listings and stats need these, so they're built on demand
+            self._counts: Optional[Dict[str, Counter]] = None
 
     def _load_bookmarks(self) -> List[Dict[str, str]]:
-        """Load bookmarks from JSON file or create empty list if file doesn't exist."""
+        """Load bookmarks from JSON file or create empty list if file doesn't exist.
+
+        Uses orjson when it is installed, falling back to the standard json module.
+        """
         if not os.path.exists(self.data_file):
             return []
 
         try:
-            with open(self.data_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(self.data_file, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0:
+                    return []
+                # Parse straight out of the page cache instead of copying the file
+                with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as data:
+                        return _loads(data)
         except (json.JSONDecodeError, IOError) as e:
             print(f"Error loading bookmarks file: {e}")
             print("Starting with empty bookmark collection.")
             return []
 
-    def _save_bookmarks(self) -> bool:
-        """Save bookmarks to JSON file. Returns True on success, False on failure."""
+    @staticmethod
+    def _cache_lowered(bookmark: Dict[str, str]) -> None:
+        """Store lowercased copies of the searchable fields (never persisted)."""
+        bookmark["_url_lc"] = bookmark["url"].lower()
+        bookmark["_title_lc"] = bookmark["title"].lower()
+        bookmark["_tag_lc"] = bookmark["tag"].lower()
+
+    def _lowered(self, field: str) -> str:
+        """Cache the lowercased field on every bookmark and return its key."""
+        self._ensure_loaded()
+        key = f"_{field}_lc"
+        if field not in self._lowered_fields:
+            for bookmark in self._bookmarks:
+                bookmark[key] = bookmark[field].lower()
+            self._lowered_fields.add(field)
+        return key
+
+    def _index(self, field: str) -> Dict[str, List[int]]:
+        """Return the lowercased value -> indices index for field, built on first use."""
+        self._ensure_loaded()
+        index = self._indexes.get(field)
+        if index is None:
+            key = self._lowered(field)
+            index = self._indexes[field] = defaultdict(list)
+            for i, bookmark in enumerate(self._bookmarks):
+                index[bookmark[key]].append(i)
+        return index
+
+    def _build_value_counts(self) -> None:
+        """Count how many bookmarks share each tag and each title."""
+        self._counts: Dict[str, Counter] = {
+            "tag": Counter(bookmark["tag"] for bookmark in self.bookmarks),
+            "title": Counter(bookmark["title"] for bookmark in self.bookmarks),
+        }
+        # Sorted views are built on first use and then kept up to date in place
+        self._sorted: Dict[str, List[str]] = {}
+
+    def _update_value_counts(self, bookmark: Dict[str, str], delta: int) -> None:
+        """Count a bookmark in (delta=1) or out of (delta=-1) the tag/title sets."""
+        if self._counts is None:
+            return
+        for field, counts in self._counts.items():
+            value = bookmark[field]
+            counts[value] += delta
+            values = self._sorted.get(field)
+            if counts[value] <= 0:
+                del counts[value]
+                if values is not None:
+                    del values[bisect_left(values, value)]
+            elif delta > 0 and counts[value] == 1 and values is not None:
+                insort(values, value)
+
+    def _sorted_values(self, field: str) -> List[str]:
+        """Return the sorted unique values of the given field."""
+        self._ensure_loaded()
+        if self._counts is None:
+            self._build_value_counts()
+        values = self._sorted.get(field)
+        if values is None:
+            values = self._sorted[field] = sorted(self._counts[field])
+        return values
+
+    def _save_bookmarks(self, bookmarks: Optional[List[Dict[str, str]]] = None) -> bool:
+        """Save bookmarks to JSON file. Returns True on success, False on failure.
+
+        Saves the given list, or self.bookmarks if none is given, so callers can
+        persist a change before applying it in memory. The file is written to a
+        temporary sibling and swapped into place, so a failed save never leaves
+        a truncated bookmark file behind. A symlinked data file is followed and the
+        existing file's permissions are kept.
+        """
+        if bookmarks is None:
+            bookmarks = self.bookmarks
+        target = os.path.realpath(self.data_file)
+        tmp_file = target + ".tmp"
         try:
-            with open(self.data_file, "w", encoding="utf-8") as f:
-                json.dump(self.bookmarks, f, indent=2, ensure_ascii=False)
+            data = _dumps(bookmarks, self.pretty)
+            with open(tmp_file, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            try:
+                os.chmod(tmp_file, stat.S_IMODE(os.stat(target).st_mode))
+            except FileNotFoundError:
+                pass
+            os.replace(tmp_file, target)
             return True
         except IOError as e:
             print(f"Error saving bookmarks: {e}")
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
             return False
 
+    def _persist_added(self, new_bookmarks: List[Dict[str, str]]) -> bool:
+        """Persist bookmarks that are about to be appended. Returns True on success."""
+        return self._save_bookmarks(self.bookmarks + new_bookmarks)
+
+    def _persist_removed(
+        self, removed: List[Dict[str, str]], remaining: List[Dict[str, str]]
+    ) -> bool:
+        """Persist the removal of bookmarks, leaving remaining. Returns True on success."""
+        return self._save_bookmarks(remaining)
+
     def _validate_url(self, url: str) -> bool:
-        """Validate URL format using urllib.parse."""
-        try:
-            result = urlparse(url)
-            return all([result.scheme, result.netloc])
-        except Exception:
-            return False
+        """Validate that the URL has a scheme and a network location."""
+        return _URL_RE.match(url) is not None
 
     def _find_bookmark_by_url(self, url: str) -> Optional[int]:
         """Find bookmark index by URL. Returns index or None if not found."""
-        for i, bookmark in enumerate(self.bookmarks):
-            if bookmark["url"].lower() == url.lower():
-                return i
-        return None
+        indices = self._index("url").get(url.lower())
+        return indices[0] if indices else None
 
     def _find_bookmarks_by_title(self, title: str) -> List[int]:
         """Find bookmark indices by title (case-insensitive). Returns list of indices."""
-        indices = []
-        title_lower = title.lower()
-        for i, bookmark in enumerate(self.bookmarks):
-            if bookmark["title"].lower() == title_lower:
-                indices.append(i)
-        return indices
+        return list(self._index("title").get(title.lower(), []))
+
+    def _find_bookmarks_by_tag(self, tag: str) -> List[int]:
+        """Find bookmark indices by tag (case-insensitive). Returns list of indices."""
+        return list(self._index("tag").get(tag.lower(), []))
+
+    def _search_matches(
+        self, field: str, query_lower: str, prefix: bool = False
+    ) -> Iterator[Dict[str, str]]:
+        """Yield bookmarks whose title or tag contains (or starts with) the query."""
+        if prefix:
+            key = self._lowered(field)
+            return (
+                bookmark
+                for bookmark in self.bookmarks
+                if bookmark[key].startswith(query_lower)
+            )
+        if field == "tag":
+            # Far fewer distinct tags than bookmarks, so test each tag only once
+            indices = sorted(
+                i
+                for tag, tag_indices in self._index("tag").items()
+                if query_lower in tag
+                for i in tag_indices
+            )
+            return (self.bookmarks[i] for i in indices)
+        key = self._lowered(field)
+        return (bookmark for bookmark in self.bookmarks if query_lower in bookmark[key])
 
     def add_bookmark(self, url: str, title: str, tag: str) -> bool:
         """Add a new bookmark. Returns True on success, False on failure."""
@@ -78,11 +303,6 @@ class BookmarkManager:
             print(f"Error: Invalid URL format: {url}")
             return False
 
-        # Check if URL already exists
-        if self._find_bookmark_by_url(url) is not None:
-            print(f"Error: Bookmark with URL '{url}' already exists.")
-            return False
-
         # Validate required fields
         if not title.strip():
             print("Error: Title cannot be empty.")
@@ -92,22 +312,72 @@ class BookmarkManager:
             print("Error: Tag cannot be empty.")
             return False
 
+        # Check if URL already exists (the first check that needs the bookmarks)
+        if self._find_bookmark_by_url(url) is not None:
+            print(f"Error: Bookmark with URL '{url}' already exists.")
+            return False
+
         # Add bookmark
         new_bookmark = {"url": url.strip(), "title": title.strip(), "tag": tag.strip()}
+        self._cache_lowered(new_bookmark)
+
+        # Persist first; memory only changes once the new file is in place
+        if not self._persist_added([new_bookmark]):
+            return False
 
-        self.bookmarks.append(new_bookmark)
+        self._append_bookmark(new_bookmark)
+        print("✓ Bookmark added successfully:")
+        print(f"  Title: {new_bookmark['title']}")
+        print(f"  URL: {new_bookmark['url']}")
+        print(f"  Tag: {new_bookmark['tag']}")
+        return True
 
-        if self._save_bookmarks():
-            print("✓ Bookmark added successfully:")
-            print(f"  Title: {new_bookmark['title']}")
-            print(f"  URL: {new_bookmark['url']}")
-            print(f"  Tag: {new_bookmark['tag']}")
+    def add_many(self, entries: Iterable[Tuple[str, str, str]]) -> bool:
+        """Add (url, title, tag) entries with a single save. Returns True on success.
+
+        Invalid entries and URLs that already exist are reported and skipped.
+        """
+        new_bookmarks = []
+        new_urls = set()
+        for url, title, tag in entries:
+            if not self._validate_url(url):
+                print(f"Skipping invalid URL: {url}")
+                continue
+            if not title.strip() or not tag.strip():
+                print(f"Skipping {url}: title and tag cannot be empty.")
+                continue
+
+            bookmark = {"url": url.strip(), "title": title.strip(), "tag": tag.strip()}
+            self._cache_lowered(bookmark)
+            if (
+                self._find_bookmark_by_url(bookmark["url"]) is not None
+                or bookmark["_url_lc"] in new_urls
+            ):
+                print(f"Skipping {url}: bookmark already exists.")
+                continue
+            new_urls.add(bookmark["_url_lc"])
+            new_bookmarks.append(bookmark)
+
+        if not new_bookmarks:
+            print("No new bookmarks to add.")
             return True
-        else:
-            # Remove the bookmark if save failed
-            self.bookmarks.pop()
+
+        if not self._persist_added(new_bookmarks):
             return False
 
+        for bookmark in new_bookmarks:
+            self._append_bookmark(bookmark)
+        print(f"✓ Added {len(new_bookmarks)} bookmark(s).")
+        return True
+
+    def _append_bookmark(self, bookmark: Dict[str, str]) -> None:
+        """Append an already saved bookmark and add it to every built index."""
+        self.bookmarks.append(bookmark)
+        position = len(self.bookmarks) - 1
+        for field, index in self._indexes.items():
+            index[bookmark[f"_{field}_lc"]].append(position)
+        self._update_value_counts(bookmark, 1)
+
     def list_bookmarks(
         self, filter_type: Optional[str] = None, filter_value: Optional[str] = None
     ) -> None:
@@ -116,20 +386,18 @@ class BookmarkManager:
 
         # Apply filter if specified
         if filter_type and filter_value:
-            bookmarks_to_show = []
-            filter_value_lower = filter_value.lower()
-
-            for bookmark in self.bookmarks:
-                if (
-                    filter_type == "title"
-                    and bookmark["title"].lower() == filter_value_lower
-                ):
-                    bookmarks_to_show.append(bookmark)
-                elif (
-                    filter_type == "tag"
-                    and bookmark["tag"].lower() == filter_value_lower
-                ):
-                    bookmarks_to_show.append(bookmark)
+            # Dispatch on the filter once instead of once per bookmark
+            if filter_type == "title":
+                bookmarks_to_show = [
+                    self.bookmarks[i]
+                    for i in self._find_bookmarks_by_title(filter_value)
+                ]
+            elif filter_type == "tag":
+                bookmarks_to_show = [
+                    self.bookmarks[i] for i in self._find_bookmarks_by_tag(filter_value)
+                ]
+            else:
+                bookmarks_to_show = []
 
         if not bookmarks_to_show:
             if filter_type:
@@ -138,41 +406,46 @@ class BookmarkManager:
                 print("No bookmarks found.")
             return
 
-        # Display header
+        # Build the whole listing and emit it with a single write
         if filter_type:
-            print(
-                f"\n📚 Found {len(bookmarks_to_show)} bookmark(s) with {filter_type}: '{filter_value}'"
-            )
+            chunks = [
+                f"\n📚 Found {len(bookmarks_to_show)} bookmark(s) with {filter_type}: '{filter_value}'\n"
+            ]
         else:
-            print(f"\n📚 Found {len(bookmarks_to_show)} bookmark(s):")
-        print("-" * 80)
+            chunks = [f"\n📚 Found {len(bookmarks_to_show)} bookmark(s):\n"]
+        chunks.append("-" * 80 + "\n")
 
         for i, bookmark in enumerate(bookmarks_to_show, 1):
-            print(f"{i:2d}. {bookmark['title']}")
-            print(f"    URL: {bookmark['url']}")
-            print(f"    Tag: {bookmark['tag']}")
-            print()
+            chunks.append(
+                f"{i:2d}. {bookmark['title']}\n"
+                f"    URL: {bookmark['url']}\n"
+                f"    Tag: {bookmark['tag']}\n\n"
+            )
+        sys.stdout.write("".join(chunks))
 
-    def search_bookmarks(self, query: str, search_type: str = "title") -> None:
-        """Search bookmarks by title or tag (case-insensitive)."""
+    def search_bookmarks(
+        self, query: str, search_type: str = "title", prefix: bool = False
+    ) -> None:
+        """Search bookmarks by title or tag (case-insensitive), optionally by prefix."""
         if not query.strip():
             print("Error: Search query cannot be empty.")
             return
 
         query_lower = query.lower()
-        tag_matches = []
 
         if search_type == "title":
-            for bookmark in self.bookmarks:
-                if query_lower in bookmark["title"].lower():
-                    print(bookmark["url"])
-                    return bookmark["url"]
+            # Only the first match is needed, so stop consuming matches there
+            bookmark = next(self._search_matches("title", query_lower, prefix), None)
+            if bookmark is not None:
+                print(bookmark["url"])
+                return bookmark["url"]
         elif search_type == "tag":
-            for bookmark in self.bookmarks:
-                if query_lower in bookmark["tag"].lower():
-                    tag_matches.append(bookmark["title"])
-            for tag in tag_matches:
-                print(tag)
+            tag_matches = [
+                bookmark["title"]
+                for bookmark in self._search_matches("tag", query_lower, prefix)
+            ]
+            if tag_matches:
+                sys.stdout.write("\n".join(tag_matches) + "\n")
             return tag_matches
 
         return None
@@ -208,48 +481,40 @@ class BookmarkManager:
             print("All matching bookmarks will be deleted.")
 
         # Create a new list of bookmarks excluding the ones to be deleted
+        # Compare based on URL for uniqueness
+        key = self._lowered("url")
+        urls_to_remove = frozenset(b[key] for b in bookmarks_to_remove)
         new_bookmarks = []
-        deleted_count = 0
         deleted_bookmarks_info = []  # To store info for printing success message
 
         for bookmark in self.bookmarks:
-            is_deleted = False
-            for b_to_remove in bookmarks_to_remove:
-                # Compare based on URL for uniqueness
-                if bookmark["url"].lower() == b_to_remove["url"].lower():
-                    is_deleted = True
-                    deleted_count += 1
-                    deleted_bookmarks_info.append(bookmark)
-                    break
-            if not is_deleted:
+            if bookmark[key] in urls_to_remove:
+                deleted_bookmarks_info.append(bookmark)
+            else:
                 new_bookmarks.append(bookmark)
+        deleted_count = len(deleted_bookmarks_info)
 
-        # Store current bookmarks in case of save failure
-        original_bookmarks = self.bookmarks
-
-        # Attempt to save the new list
-        self.bookmarks = new_bookmarks
-        if self._save_bookmarks():
-            print(f"✓ Deleted {deleted_count} bookmark(s):")
-            for bookmark in deleted_bookmarks_info:
-                print(f"  - {bookmark['title']} ({bookmark['url']})")
-            return True
-        else:
-            # Revert to original bookmarks if save failed
-            self.bookmarks = original_bookmarks
+        # Persist the new list first; memory only changes once it is saved
+        if not self._persist_removed(deleted_bookmarks_info, new_bookmarks):
             print("Error: Failed to save changes. Bookmarks were not deleted.")
             return False
 
+        self.bookmarks = new_bookmarks
+        self._indexes = {}
+        for bookmark in deleted_bookmarks_info:
+            self._update_value_counts(bookmark, -1)
+        print(f"✓ Deleted {deleted_count} bookmark(s):")
+        for bookmark in deleted_bookmarks_info:
+            print(f"  - {bookmark['title']} ({bookmark['url']})")
+        return True
+
     def list_tags(self) -> None:
         """Display all unique tags in the bookmark collection."""
         if not self.bookmarks:
             print("No bookmarks found.")
             return
 
-        tags = sorted(set(bookmark["tag"] for bookmark in self.bookmarks))
-
-        for tag in tags:
-            print(f"{tag}")
+        sys.stdout.write("\n".join(self._sorted_values("tag")) + "\n")
 
     def list_titles(self) -> None:
         """Display all unique titles in the bookmark collection."""
@@ -257,10 +522,7 @@ class BookmarkManager:
             print("No bookmarks found.")
             return
 
-        titles = sorted(set(bookmark["title"] for bookmark in self.bookmarks))
-
-        for title in titles:
-            print(f"{title}")
+        sys.stdout.write("\n".join(self._sorted_values("title")) + "\n")
 
     def show_stats(self) -> None:
         """Display statistics about the bookmark collection."""
@@ -268,8 +530,7 @@ class BookmarkManager:
             print("No bookmarks found.")
             return
 
-        # Count unique tags
-        tags = set(bookmark["tag"] for bookmark in self.bookmarks)
+        tags = self._sorted_values("tag")
 
         print("\n📊 Bookmark Statistics:")
         print(f"  Total bookmarks: {len(self.bookmarks)}")
@@ -277,7 +538,149 @@ class BookmarkManager:
         print(f"  Data file: {self.data_file}")
 
         if tags:
-            print(f"  Tags: {', '.join(sorted(tags))}")
+            print(f"  Tags: {', '.join(tags)}")
+
+
+class SQLiteBookmarkManager(BookmarkManager):
+    """Bookmark manager backed by an SQLite database with an FTS5 search index."""
+
+    __slots__ = ("_conn",)
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS bookmarks (
+            id INTEGER PRIMARY KEY,
+            url TEXT NOT NULL,
+            title TEXT NOT NULL,
+            tag TEXT NOT NULL
+        );
+        CREATE UNIQUE INDEX IF NOT EXISTS bookmarks_url
+            ON bookmarks (url COLLATE NOCASE);
+        CREATE VIRTUAL TABLE IF NOT EXISTS bookmarks_fts USING fts5(
+            url UNINDEXED, title, tag,
+            content='bookmarks', content_rowid='id', tokenize='trigram'
+        );
+        CREATE TRIGGER IF NOT EXISTS bookmarks_ai AFTER INSERT ON bookmarks BEGIN
+            INSERT INTO bookmarks_fts (rowid, url, title, tag)
+                VALUES (new.id, new.url, new.title, new.tag);
+        END;
+        CREATE TRIGGER IF NOT EXISTS bookmarks_ad AFTER DELETE ON bookmarks BEGIN
+            INSERT INTO bookmarks_fts (bookmarks_fts, rowid, url, title, tag)
+                VALUES ('delete', old.id, old.url, old.title, old.tag);
+        END;
+    """
+
+    def __init__(self, data_file: str, pretty: bool = False):
+        """Open (creating if needed) the SQLite database at the given path."""
+        # Imported here so the JSON backend doesn't pay for it at startup
+        import sqlite3
+
+        self._conn = sqlite3.connect(data_file)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(self.SCHEMA)
+        super().__init__(data_file, pretty)
+
+    def _load_bookmarks(self) -> List[Dict[str, str]]:
+        """Load bookmarks from the database in insertion order."""
+        return [
+            dict(row)
+            for row in self._conn.execute(
+                "SELECT url, title, tag FROM bookmarks ORDER BY id"
+            )
+        ]
+
+    def _write(self, *statements: Tuple[str, List[Tuple[str, ...]]]) -> bool:
+        """Run (sql, rows) statements in one transaction. Returns True on success."""
+        import sqlite3
+
+        try:
+            with self._conn:
+                for sql, rows in statements:
+                    self._conn.executemany(sql, rows)
+            return True
+        except sqlite3.Error as e:
+            print(f"Error saving bookmarks: {e}")
+            return False
+
+    @staticmethod
+    def _insert_statement(
+        bookmarks: List[Dict[str, str]],
+    ) -> Tuple[str, List[Tuple[str, ...]]]:
+        return (
+            "INSERT INTO bookmarks (url, title, tag) VALUES (?, ?, ?)",
+            [
+                (bookmark["url"], bookmark["title"], bookmark["tag"])
+                for bookmark in bookmarks
+            ],
+        )
+
+    def _save_bookmarks(self, bookmarks: Optional[List[Dict[str, str]]] = None) -> bool:
+        """Replace every stored row with the given list (self.bookmarks by default)."""
+        if bookmarks is None:
+            bookmarks = self.bookmarks
+        return self._write(
+            ("DELETE FROM bookmarks", [()]), self._insert_statement(bookmarks)
+        )
+
+    def _persist_added(self, new_bookmarks: List[Dict[str, str]]) -> bool:
+        """Insert just the new rows."""
+        return self._write(self._insert_statement(new_bookmarks))
+
+    def _persist_removed(
+        self, removed: List[Dict[str, str]], remaining: List[Dict[str, str]]
+    ) -> bool:
+        """Delete just the removed rows, looked up through the NOCASE url index."""
+        return self._write(
+            (
+                "DELETE FROM bookmarks WHERE url = ? COLLATE NOCASE",
+                [(bookmark["url"],) for bookmark in removed],
+            )
+        )
+
+    def _search_matches(
+        self, field: str, query_lower: str, prefix: bool = False
+    ) -> Iterator[Dict[str, str]]:
+        """Yield rows whose title or tag contains the query using the FTS5 index."""
+        if prefix:
+            return super()._search_matches(field, query_lower, prefix)
+        if len(query_lower) >= 3:
+            phrase = query_lower.replace('"', '""')
+            return self._conn.execute(
+                "SELECT url, title FROM bookmarks_fts WHERE bookmarks_fts MATCH ? "
+                "ORDER BY rowid",
+                (f'{field} : "{phrase}"',),
+            )
+        # Trigrams need at least three characters, so shorter queries fall back to LIKE
+        pattern = (
+            query_lower.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        )
+        return self._conn.execute(
+            f"SELECT url, title FROM bookmarks_fts WHERE {field} LIKE ? ESCAPE '\\' "
+            "ORDER BY rowid",
+            (f"%{pattern}%",),
+        )
+
+
+def read_csv_entries(path: str) -> Optional[List[Tuple[str, str, str]]]:
+    """Read (url, title, tag) rows from a CSV file, reporting malformed rows.
+
+    Returns None if the file can't be read.
+    """
+    # Only imports need the csv module, so keep it off the startup path
+    import csv
+
+    entries = []
+    try:
+        # utf-8-sig drops the byte order mark spreadsheet exports often start with
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            for line_number, row in enumerate(csv.reader(f), 1):
+                if len(row) == 3:
+                    entries.append((row[0], row[1], row[2]))
+                elif row:
+                    print(f"Skipping line {line_number}: expected url,title,tag")
+    except (IOError, UnicodeDecodeError, csv.Error) as e:
+        print(f"Error reading import file: {e}")
+        return None
+    return entries
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -286,6 +689,7 @@ def create_parser() -> argparse.ArgumentParser:
         description="Simple Command-Line Bookmark Manager",
         epilog="Examples:\n"
         "  %(prog)s add https://example.com 'Example Site' tech\n"
+        "  %(prog)s add --from bookmarks.csv\n"
         "  %(prog)s list\n"
         "  %(prog)s list --title 'GitHub'\n"
         "  %(prog)s list --tag development\n"
@@ -293,6 +697,7 @@ def create_parser() -> argparse.ArgumentParser:
         "  %(prog)s titles\n"
         "  %(prog)s search python\n"
         "  %(prog)s search --tag web\n"
+        "  %(prog)s search --prefix py\n"
         "  %(prog)s delete https://example.com\n"
         "  %(prog)s delete --title 'Example Site'",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -301,9 +706,15 @@ def create_parser() -> argparse.ArgumentParser:
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
     # Add bookmark command
     add_parser = subparsers.add_parser("add", help="Add a new bookmark")
-    add_parser.add_argument("url", help="URL of the bookmark")
-    add_parser.add_argument("title", help="Title of the bookmark")
-    add_parser.add_argument("tag", help="Tag for the bookmark")
+    add_parser.add_argument("url", nargs="?", help="URL of the bookmark")
+    add_parser.add_argument("title", nargs="?", help="Title of the bookmark")
+    add_parser.add_argument("tag", nargs="?", help="Tag for the bookmark")
+    add_parser.add_argument(
+        "--from",
+        dest="from_file",
+        metavar="FILE",
+        help="Import bookmarks from a CSV file of url,title,tag rows",
+    )
 
     # List bookmarks command
     list_parser = subparsers.add_parser("list", help="List all bookmarks")
@@ -316,6 +727,11 @@ def create_parser() -> argparse.ArgumentParser:
     search_parser.add_argument(
         "--tag", action="store_true", help="Search by tag instead of title"
     )
+    search_parser.add_argument(
+        "--prefix",
+        action="store_true",
+        help="Only match titles or tags starting with the query",
+    )
 
     # Delete bookmark command
     delete_parser = subparsers.add_parser("delete", help="Delete a bookmark")
@@ -335,8 +751,14 @@ def create_parser() -> argparse.ArgumentParser:
     # Data file option
     parser.add_argument(
         "--file",
-        default="bookmarks.json",
-        help="Bookmark data file (default: bookmarks.json)",
+        default=bookmarks_path,
+        help="Bookmark data file; a *.db file uses the SQLite backend "
+        "(default: ~/.bookmarks.json)",
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Write the JSON data file indented for reading by hand",
     )
 
     return parser
@@ -352,13 +774,28 @@ def main() -> None:
         parser.print_help()
         return
 
-    # Initialize bookmark manager
-    manager = BookmarkManager(bookmarks_path)
+    if args.command == "add":
+        positionals = (args.url, args.title, args.tag)
+        if args.from_file is None and None in positionals:
+            parser.error("add requires url, title and tag (or --from FILE)")
+        if args.from_file is not None and positionals != (None, None, None):
+            parser.error("add --from cannot be combined with url, title and tag")
 
     try:
+        # Initialize bookmark manager, using SQLite for *.db files
+        if args.file.endswith(".db"):
+            manager = SQLiteBookmarkManager(args.file, args.pretty)
+        else:
+            manager = BookmarkManager(args.file, args.pretty)
+
         # Execute the requested command
         if args.command == "add":
-            manager.add_bookmark(args.url, args.title, args.tag)
+            if args.from_file is not None:
+                entries = read_csv_entries(args.from_file)
+                if entries is not None:
+                    manager.add_many(entries)
+            else:
+                manager.add_bookmark(args.url, args.title, args.tag)
 
         elif args.command == "list":
             # Handle filtering options
@@ -371,7 +808,7 @@ def main() -> None:
 
         elif args.command == "search":
             search_type = "tag" if args.tag else "title"
-            manager.search_bookmarks(args.query, search_type)
+            manager.search_bookmarks(args.query, search_type, args.prefix)
 
         elif args.command == "delete":
             if args.url: